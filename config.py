@@ -1,7 +1,8 @@
 from filter_toolkit import (
     AND, OR, NOT, eq, ne, contains, startswith, endswith,
     regex, gt, lt, ge, le, date_eq, date_ne, date_gt,
-    date_lt, date_ge, date_le, bool_eq, bool_ne, custom
+    date_lt, date_ge, date_le, bool_eq, bool_ne, custom,
+    compile_filter
 )
 
 # CSV header
@@ -84,4 +85,7 @@ filter_obj = AND(
             contains("CORREIO_ELETRONICO", "@gmail.com.br"),
             contains("CORREIO_ELETRONICO", "@ymail")
         )
-    ), """
\ No newline at end of file
+    ), """
+# The schema and filter above are static, so specialize the predicate once
+# at import time; callers use filter_row_fast(row) with no columns argument
+filter_row_fast = compile_filter(filter_obj, columns)
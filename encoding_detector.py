@@ -2,69 +2,70 @@
 Encoding detection utilities for CSV files.
 """
 
-import chardet
+import io
 from typing import Tuple, List
 import csv
 
-def detect_encoding(file_path: str, sample_size: int = 10000) -> Tuple[str, List[str]]:
+def detect_encoding(file_path: str, sample_size: int = 65536) -> Tuple[str, List[str], bool]:
     """
     Detect the encoding of a CSV file by analyzing a sample.
     Also returns the first row to validate the header.
 
+    For this dataset the encoding is one of a handful of options, so a
+    statistical detector is overkill: check for a UTF-8 BOM, then test
+    whether the sample is valid UTF-8, and otherwise fall back to latin-1
+    (which decodes any byte sequence). One sample read replaces the chardet
+    pass plus the chain of full-file decode attempts.
+
     Args:
         file_path: Path to the CSV file
         sample_size: Number of bytes to sample
 
     Returns:
-        Tuple[str, List[str]]: Detected encoding and first row
+        Tuple[str, List[str], bool]: Detected encoding, first row, and
+        whether the sample decoded cleanly — when True, callers can skip a
+        separate validate_encoding() pass.
     """
-    # Read sample bytes
+    # Read sample bytes; a short read means the sample covers the whole
+    # file, so an error at its end is a real one, not a cut-off character
     with open(file_path, 'rb') as f:
         sample = f.read(sample_size)
-    
-    # Check for non-ASCII bytes first
-    has_non_ascii = any(b > 127 for b in sample)
-    
-    # If we have non-ASCII bytes, try UTF-8 first
-    if has_non_ascii:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f, delimiter=';', quotechar='"')
-                first_row = next(reader)
-                print("Successfully validated with utf-8")
-                return 'utf-8', first_row
-        except Exception as e:
-            print(f"Failed to validate with utf-8: {str(e)}")
-    
-    # Use chardet for encoding detection
-    result = chardet.detect(sample)
-    detected_encoding = result['encoding']
-    confidence = result['confidence']
-    
-    # If ASCII is detected but we have non-ASCII bytes, force UTF-8
-    if detected_encoding == 'ascii' and has_non_ascii:
-        detected_encoding = 'utf-8'
-        confidence = 0.8
-    
-    print(f"Detected encoding: {detected_encoding} (confidence: {confidence:.2f})")
-    print(f"Non-ASCII bytes found: {has_non_ascii}")
-    
-    # Try to read first row to validate
-    encodings_to_try = [detected_encoding, 'latin-1', 'cp1252']
-    
-    for enc in encodings_to_try:
+    truncated = len(sample) == sample_size
+
+    if sample.startswith(b'\xef\xbb\xbf'):
+        encoding = 'utf-8-sig'
+    else:
         try:
-            with open(file_path, 'r', encoding=enc) as f:
-                reader = csv.reader(f, delimiter=';', quotechar='"')
-                first_row = next(reader)
-                print(f"Successfully validated with {enc}")
-                return enc, first_row
-        except Exception as e:
-            print(f"Failed to validate with {enc}: {str(e)}")
-            continue
-    
-    # If all else fails, return latin-1
-    return 'latin-1', []
+            sample.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off at the end of the sample is not
+            # evidence against UTF-8 — but only if the sample really was cut
+            # short rather than ending at EOF
+            if truncated and e.start >= len(sample) - 3:
+                encoding = 'utf-8'
+            else:
+                encoding = 'latin-1'
+
+    print(f"Detected encoding: {encoding}")
+
+    # Parse the header out of the sample already in memory; a clean decode
+    # here means the encoding needs no further validation
+    try:
+        decoded = sample.decode(encoding)
+        validated = True
+    except UnicodeDecodeError as e:
+        decoded = sample.decode(encoding, errors='replace')
+        # A character truncated at the sample boundary still counts as
+        # clean, but only if the sample really was truncated
+        validated = truncated and e.start >= len(sample) - 3
+    reader = csv.reader(io.StringIO(decoded), delimiter=';', quotechar='"')
+    try:
+        first_row = next(reader)
+    except StopIteration:
+        first_row = []
+        validated = False
+    return encoding, first_row, validated
 
 def validate_encoding(file_path: str, encoding: str, num_rows: int = 5) -> bool:
     """
@@ -29,6 +29,20 @@ import re
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Union
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Columns whose value is a comma-separated list of codes; predicates match
+# against each element instead of the raw string
+MULTI_VALUE_FIELDS = {'CNAE_FISCAL_SECUNDARIA'}
+
 
 def AND(*conditions: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -111,6 +125,22 @@ def contains(field: str, value: str) -> Dict[str, Any]:
     return {"field": field, "op": "contains", "value": value}
 
 
+def contains_any(field: str, values: List[str]) -> Dict[str, Any]:
+    """
+    Contains-any operation. Returns True if the field value contains any of
+    the specified substrings. Equivalent to OR(contains(field, v) for v in
+    values) but evaluated as a single scan of the field.
+
+    Args:
+        field: The field name.
+        values: The substrings to search for.
+
+    Returns:
+        Dict[str, Any]: A dictionary representing the contains-any condition.
+    """
+    return {"field": field, "op": "contains_any", "value": tuple(values)}
+
+
 def startswith(field: str, value: str) -> Dict[str, Any]:
     """
     Starts with operation. Returns True if the field value starts with the specified substring.
@@ -143,6 +173,10 @@ def regex(field: str, value: str) -> Dict[str, Any]:
     """
     Regex operation. Returns True if the field value matches the specified regex pattern.
 
+    The pattern is compiled here, once, so evaluators call the compiled
+    object's search method directly instead of going through the re module's
+    bounded pattern cache on every row.
+
     Args:
         field: The field name.
         value: The regex pattern.
@@ -150,7 +184,7 @@ def regex(field: str, value: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary representing the regex condition.
     """
-    return {"field": field, "op": "regex", "value": value}
+    return {"field": field, "op": "regex", "value": re.compile(value, re.IGNORECASE)}
 
 
 def gt(field: str, value: Union[int, float]) -> Dict[str, Any]:
@@ -335,68 +369,503 @@ def custom(field: str, func: Callable[[Any], bool]) -> Dict[str, Any]:
     return {"field": field, "op": "custom", "value": func}
 
 
-def filter_row(row: List[str], columns: List[str], filter_obj: Dict[str, Any]) -> bool:
+def _common_contains_field(conditions) -> Union[str, None]:
     """
-    Apply a filter object to a row of data.
+    Return the shared field name if every condition is a plain contains
+    condition on the same field, otherwise None.
+    """
+    field = None
+    for condition in conditions:
+        if condition.get('op') != 'contains':
+            return None
+        if field is None:
+            field = condition.get('field')
+        elif condition.get('field') != field:
+            return None
+    return field
+
+
+def _condition_cost(condition: Dict[str, Any]) -> int:
+    """
+    Static cost estimate for a condition, used to order AND/OR children so
+    that cheap comparisons run before expensive scans. Lower is cheaper.
+    """
+    op = condition.get('op')
+    if op == 'eq':
+        return 1
+    elif op == 'ne':
+        return 2
+    elif op in ('startswith', 'endswith'):
+        return 3
+    elif op == 'contains':
+        return 4
+    elif op == 'contains_any':
+        return 8 + len(condition.get('value', ()))
+    elif op == 'regex':
+        return 10
+    elif op == 'NOT':
+        return _condition_cost(condition.get('condition', {}))
+    elif op in ('AND', 'OR'):
+        return sum(_condition_cost(c) for c in condition.get('conditions', []))
+    return 5
+
+
+def compile_filter(filter_obj: Dict[str, Any], columns: List[str],
+                   as_bytes: bool = False) -> Callable[[List[str]], bool]:
+    """
+    Compile a filter object into a fast row predicate.
+
+    Resolves every field name to its integer column index once, at compile
+    time, instead of calling columns.index() for each condition on every row.
+    The whole tree is lowered to the source of a single Python function —
+    one and/or/not expression with comparison constants inlined as literals
+    — which is then compile()d and exec'd. Evaluating a row is one function
+    call in one frame: no recursion, no dict lookups, no per-predicate call
+    overhead. Each referenced column is lowercased (and multi-value columns
+    split) once per row into a local at the top of the generated function.
+
+    AND/OR children are evaluated in ascending cost order (cheap eq/ne
+    comparisons before contains and regex scans), not in the order they were
+    written, so most rows are decided by the cheapest predicates before any
+    expensive scan runs. Short-circuit semantics are unchanged: conditions
+    have no side effects, so the result is order-independent.
 
     Args:
-        row: List of values from the CSV row
-        columns: List of column names
         filter_obj: Filter object defining the conditions
+        columns: List of column names
+        as_bytes: Compile for rows of bytes fields instead of str. Needles
+            and patterns are encoded to latin-1 constants at compile time,
+            so the hot path is a C-level bytes scan with no decoding or
+            unicode casefolding. Case-insensitivity is ASCII-only in this
+            mode (accented characters are compared verbatim).
 
     Returns:
-        bool: True if row matches filter conditions
-    """
-    def evaluate_condition(condition: Dict[str, Any]) -> bool:
+        Callable[[List[str]], bool]: A predicate taking a row and returning
+        True if the row matches the filter conditions.
+    """
+    if as_bytes:
+        def conv(value: str) -> bytes:
+            return value.encode('latin-1')
+    else:
+        def conv(value: str) -> str:
+            return value
+    comma = conv(',')
+
+    # Objects that can't be spelled as literals (compiled regexes) are bound
+    # into the generated function's globals under _cN names
+    constants: Dict[str, Any] = {}
+
+    def const(value: Any) -> str:
+        name = '_c%d' % len(constants)
+        constants[name] = value
+        return name
+
+    # Locals hoisted to the top of the generated function: each referenced
+    # column is lowercased (and multi-value columns split/stripped) once per
+    # row, then shared by every predicate touching that column
+    hoisted: Dict[str, str] = {}
+
+    def lower_local(idx: int) -> str:
+        name = 'f%d' % idx
+        hoisted[name] = 'row[%d].lower()' % idx
+        return name
+
+    def split_local(idx: int) -> str:
+        name = 'm%d' % idx
+        hoisted[name] = ('[v.strip().lower() for v in row[%d].split(%r)]'
+                         % (idx, comma))
+        return name
+
+    def emit(condition: Dict[str, Any]) -> str:
         op = condition.get('op')
         if not op:
-            return True
+            return 'True'
 
         if op == 'AND':
-            return all(evaluate_condition(c) for c in condition.get('conditions', []))
+            conditions = sorted(condition.get('conditions', []), key=_condition_cost)
+            if not conditions:
+                return 'True'
+            return '(' + ' and '.join(emit(c) for c in conditions) + ')'
         elif op == 'OR':
-            return any(evaluate_condition(c) for c in condition.get('conditions', []))
+            conditions = sorted(condition.get('conditions', []), key=_condition_cost)
+            if not conditions:
+                return 'False'
+            # Fuse OR-of-contains on one field into a single contains_any, so
+            # a single alternation regex scans the field once instead of one
+            # substring search (plus a .lower() copy) per branch.
+            fused_field = _common_contains_field(conditions)
+            if fused_field is not None and len(conditions) > 1:
+                return emit(contains_any(
+                    fused_field, [c['value'] for c in conditions]))
+            return '(' + ' or '.join(emit(c) for c in conditions) + ')'
         elif op == 'NOT':
-            return not evaluate_condition(condition.get('condition', {}))
+            return '(not %s)' % emit(condition.get('condition', {}))
         elif op == 'contains':
             field = condition.get('field')
-            value = condition.get('value')
             idx = columns.index(field)
-            # Split field value by comma if it's CNAE_FISCAL_SECUNDARIA
-            if field == 'CNAE_FISCAL_SECUNDARIA':
-                field_values = [v.strip() for v in row[idx].split(',')]
-                return any(value.lower() in v.lower() for v in field_values)
-            return value.lower() in row[idx].lower()
+            needle = conv(condition.get('value')).lower()
+            # Match against each element of multi-value fields
+            if field in MULTI_VALUE_FIELDS:
+                return '(any(%r in v for v in %s))' % (needle, split_local(idx))
+            return '(%r in %s)' % (needle, lower_local(idx))
+        elif op == 'contains_any':
+            idx = columns.index(condition.get('field'))
+            # RE2 compiles the alternation to a DFA that scans the field in
+            # linear time regardless of pattern count; re backtracks per
+            # alternative, so prefer re2 when installed
+            engine = re2 if re2 is not None else re
+            pattern = engine.compile(
+                conv('(?i)' + '|'.join(map(re.escape, condition.get('value')))))
+            return '(%s(row[%d]) is not None)' % (const(pattern.search), idx)
         elif op == 'eq':
             field = condition.get('field')
-            value = condition.get('value')
             idx = columns.index(field)
-            # Split field value by comma if it's CNAE_FISCAL_SECUNDARIA
-            if field == 'CNAE_FISCAL_SECUNDARIA':
-                field_values = [v.strip() for v in row[idx].split(',')]
-                return any(value.lower() == v.lower() for v in field_values)
-            return row[idx].lower() == value.lower()
+            value = conv(condition.get('value')).lower()
+            # Match against each element of multi-value fields
+            if field in MULTI_VALUE_FIELDS:
+                return '(%r in %s)' % (value, split_local(idx))
+            return '(%s == %r)' % (lower_local(idx), value)
         elif op == 'ne':
             field = condition.get('field')
-            value = condition.get('value')
             idx = columns.index(field)
-            # Split field value by comma if it's CNAE_FISCAL_SECUNDARIA
-            if field == 'CNAE_FISCAL_SECUNDARIA':
-                field_values = [v.strip() for v in row[idx].split(',')]
-                return all(value.lower() != v.lower() for v in field_values)
-            return row[idx].lower() != value.lower()
+            value = conv(condition.get('value')).lower()
+            # Match against each element of multi-value fields
+            if field in MULTI_VALUE_FIELDS:
+                return '(%r not in %s)' % (value, split_local(idx))
+            return '(%s != %r)' % (lower_local(idx), value)
         elif op == 'regex':
             field = condition.get('field')
-            pattern = condition.get('value')
             idx = columns.index(field)
-            # Split field value by comma if it's CNAE_FISCAL_SECUNDARIA
-            if field == 'CNAE_FISCAL_SECUNDARIA':
-                field_values = [v.strip() for v in row[idx].split(',')]
-                return any(bool(re.search(pattern, v, re.IGNORECASE)) for v in field_values)
-            return bool(re.search(pattern, row[idx], re.IGNORECASE))
-        return False
-
-    return evaluate_condition(filter_obj)
+            value = condition.get('value')
+            source = value.pattern if isinstance(value, re.Pattern) else value
+            search = const(re.compile(conv(source), re.IGNORECASE).search)
+            # Match against each element of multi-value fields
+            if field in MULTI_VALUE_FIELDS:
+                return '(any(%s(v) is not None for v in %s))' % (search, split_local(idx))
+            return '(%s(row[%d]) is not None)' % (search, idx)
+        return 'False'
+
+    expression = emit(filter_obj)
+    lines = ['def _compiled(row):']
+    for name, init in hoisted.items():
+        lines.append('    %s = %s' % (name, init))
+    lines.append('    return %s' % expression)
+    source = '\n'.join(lines)
+
+    namespace = {'re': re}
+    namespace.update(constants)
+    exec(compile(source, '<compile_filter>', 'exec'), namespace)
+    return namespace['_compiled']
+
+
+def _collect_required_literals(condition: Dict[str, Any], groups: List[tuple]) -> None:
+    """
+    Collect groups of literals from the AND-reachable part of a filter tree.
+
+    Every row that can match the filter must contain, for each group, at
+    least one of that group's literals somewhere in its raw text. NOT/ne/
+    regex and unknown ops contribute nothing (they impose no positive
+    substring requirement).
+    """
+    op = condition.get('op')
+    if op == 'AND':
+        for child in condition.get('conditions', []):
+            _collect_required_literals(child, groups)
+    elif op in ('contains', 'eq'):
+        value = condition.get('value')
+        if value:
+            groups.append((value,))
+    elif op == 'contains_any':
+        values = condition.get('value')
+        if values and all(values):
+            groups.append(tuple(values))
+    elif op == 'OR':
+        alternatives = []
+        for child in condition.get('conditions', []):
+            child_op = child.get('op')
+            if child_op in ('contains', 'eq'):
+                value = child.get('value')
+                if not value:
+                    return
+                alternatives.append(value)
+            elif child_op == 'contains_any':
+                values = child.get('value')
+                if not (values and all(values)):
+                    return
+                alternatives.extend(values)
+            else:
+                # This branch guarantees no literal, so the OR guarantees none
+                return
+        if alternatives:
+            groups.append(tuple(alternatives))
+
+
+def compile_prescan(filter_obj: Dict[str, Any]) -> Union[Callable[[str], bool], None]:
+    """
+    Compile a cheap raw-line pre-filter for a filter object.
+
+    Extracts literals that any matching row must contain (from contains/eq
+    conditions under the top-level AND) and returns a predicate that tests
+    them with plain substring searches on the unparsed line. Rows it rejects
+    cannot match the full filter; rows it accepts still go through normal
+    field-level filtering, so false positives are harmless. Returns None if
+    the filter implies no required literals.
+
+    The check is per physical line, so it assumes no embedded newlines
+    inside quoted fields — true for the CNPJ dumps this tool targets.
+
+    Args:
+        filter_obj: Filter object defining the conditions
+
+    Returns:
+        A predicate taking a raw line, or None if no pre-filter applies.
+    """
+    groups: List[tuple] = []
+    _collect_required_literals(filter_obj, groups)
+    if not groups:
+        return None
+
+    clauses = []
+    for group in groups:
+        clauses.append('(' + ' or '.join(
+            '%r in line' % literal.lower() for literal in group) + ')')
+    source = ('def _prescan(line):\n'
+              '    line = line.lower()\n'
+              '    return ' + ' and '.join(clauses))
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, '<compile_prescan>', 'exec'), namespace)
+    return namespace['_prescan']
+
+
+def to_polars(filter_obj: Dict[str, Any]) -> "pl.Expr":
+    """
+    Translate a filter object into a Polars expression.
+
+    The resulting expression evaluates the whole filter as one boolean mask
+    over a columnar batch, moving the inner loop out of the Python
+    interpreter and into vectorized string kernels. Matching semantics
+    follow filter_row: all comparisons are case-insensitive and the
+    CNAE_FISCAL_SECUNDARIA field is treated as a comma-separated list for
+    eq/ne.
+
+    Args:
+        filter_obj: Filter object defining the conditions
+
+    Returns:
+        pl.Expr: Boolean expression selecting matching rows.
+
+    Raises:
+        ImportError: If polars is not installed.
+        ValueError: If the filter uses an op with no Polars translation.
+    """
+    if pl is None:
+        raise ImportError("polars is required for to_polars()")
+
+    op = filter_obj.get('op')
+    if not op:
+        return pl.lit(True)
+
+    if op == 'AND':
+        expr = pl.lit(True)
+        for condition in filter_obj.get('conditions', []):
+            expr = expr & to_polars(condition)
+        return expr
+    elif op == 'OR':
+        expr = pl.lit(False)
+        for condition in filter_obj.get('conditions', []):
+            expr = expr | to_polars(condition)
+        return expr
+    elif op == 'NOT':
+        return ~to_polars(filter_obj.get('condition', {}))
+    elif op == 'contains':
+        field = filter_obj.get('field')
+        value = filter_obj.get('value')
+        return pl.col(field).str.contains('(?i)' + re.escape(value))
+    elif op == 'contains_any':
+        field = filter_obj.get('field')
+        values = filter_obj.get('value')
+        pattern = '(?i)' + '|'.join(map(re.escape, values))
+        return pl.col(field).str.contains(pattern)
+    elif op == 'eq':
+        field = filter_obj.get('field')
+        value = filter_obj.get('value').lower()
+        if field in MULTI_VALUE_FIELDS:
+            return (pl.col(field).str.split(',')
+                    .list.eval(pl.element().str.strip_chars().str.to_lowercase() == value)
+                    .list.any())
+        return pl.col(field).str.to_lowercase() == value
+    elif op == 'ne':
+        field = filter_obj.get('field')
+        value = filter_obj.get('value').lower()
+        if field in MULTI_VALUE_FIELDS:
+            return ~(pl.col(field).str.split(',')
+                     .list.eval(pl.element().str.strip_chars().str.to_lowercase() == value)
+                     .list.any())
+        return pl.col(field).str.to_lowercase() != value
+    elif op == 'regex':
+        field = filter_obj.get('field')
+        pattern = filter_obj.get('value')
+        if isinstance(pattern, re.Pattern):
+            pattern = pattern.pattern
+        return pl.col(field).str.contains('(?i)' + pattern)
+    raise ValueError(f"No Polars translation for op: {op}")
+
+
+# Opcodes for the flat filter programs run by filter_row. Leaf instructions
+# are (op, idx, value, multi) and push a boolean; jump instructions are
+# (op, target, None, None) and implement AND/OR short-circuiting without
+# recursion.
+OP_TRUE = 0
+OP_FALSE = 1
+OP_NOT = 2
+OP_CONTAINS = 3
+OP_CONTAINS_ANY = 4
+OP_EQ = 5
+OP_NE = 6
+OP_REGEX = 7
+OP_JMP_IF_FALSE = 8
+OP_JMP_IF_TRUE = 9
+
+
+def _compile_program(filter_obj: Dict[str, Any], columns: List[str]) -> List[tuple]:
+    """
+    Lower a filter tree to a flat postfix program for the filter_row VM.
+
+    Field names are resolved to integer indices and comparison values are
+    lowercased here, once, instead of per row.
+    """
+    program = []
+
+    def emit(condition: Dict[str, Any]) -> None:
+        op = condition.get('op')
+        if not op:
+            program.append((OP_TRUE, None, None, None))
+            return
+
+        if op in ('AND', 'OR'):
+            conditions = condition.get('conditions', [])
+            if not conditions:
+                program.append((OP_TRUE if op == 'AND' else OP_FALSE,
+                                None, None, None))
+                return
+            jump_op = OP_JMP_IF_FALSE if op == 'AND' else OP_JMP_IF_TRUE
+            jumps = []
+            for i, child in enumerate(conditions):
+                emit(child)
+                if i < len(conditions) - 1:
+                    jumps.append(len(program))
+                    program.append(None)  # patched below
+            for position in jumps:
+                program[position] = (jump_op, len(program), None, None)
+        elif op == 'NOT':
+            emit(condition.get('condition', {}))
+            program.append((OP_NOT, None, None, None))
+        elif op in ('contains', 'eq', 'ne', 'regex'):
+            field = condition.get('field')
+            idx = columns.index(field)
+            value = condition.get('value')
+            if op == 'regex':
+                if not isinstance(value, re.Pattern):
+                    value = re.compile(value, re.IGNORECASE)
+            else:
+                value = value.lower()
+            leaf_op = {'contains': OP_CONTAINS, 'eq': OP_EQ,
+                       'ne': OP_NE, 'regex': OP_REGEX}[op]
+            program.append((leaf_op, idx, value, field in MULTI_VALUE_FIELDS))
+        elif op == 'contains_any':
+            idx = columns.index(condition.get('field'))
+            values = tuple(v.lower() for v in condition.get('value'))
+            program.append((OP_CONTAINS_ANY, idx, values, None))
+        else:
+            program.append((OP_FALSE, None, None, None))
+
+    emit(filter_obj)
+    return program
+
+
+# Compiled programs cached per (filter_obj, columns) identity; the cached
+# objects are kept alive so their ids stay valid. Mutating a filter dict
+# in place after its first use is not supported.
+_program_cache: Dict[tuple, tuple] = {}
+
+
+def _get_program(filter_obj: Dict[str, Any], columns: List[str]) -> List[tuple]:
+    key = (id(filter_obj), id(columns))
+    entry = _program_cache.get(key)
+    if entry is None or entry[0] is not filter_obj or entry[1] is not columns:
+        program = _compile_program(filter_obj, columns)
+        _program_cache[key] = (filter_obj, columns, program)
+        return program
+    return entry[2]
+
+
+def filter_row(row: List[str], columns: List[str], filter_obj: Dict[str, Any]) -> bool:
+    """
+    Apply a filter object to a row of data.
+
+    The filter tree is lowered (and cached) as a flat program of opcode
+    tuples, evaluated by an iterative loop with a boolean stack and jump
+    instructions for AND/OR short-circuiting — no recursion and no dict
+    lookups per condition. For one-off compilation with maximum per-row
+    throughput, see compile_filter.
+
+    Args:
+        row: List of values from the CSV row
+        columns: List of column names
+        filter_obj: Filter object defining the conditions
+
+    Returns:
+        bool: True if row matches filter conditions
+    """
+    program = _get_program(filter_obj, columns)
+    stack = []
+    push = stack.append
+    pc = 0
+    size = len(program)
+    while pc < size:
+        op, idx, value, multi = program[pc]
+        pc += 1
+        if op == OP_CONTAINS:
+            if multi:
+                push(any(value in v.strip().lower() for v in row[idx].split(',')))
+            else:
+                push(value in row[idx].lower())
+        elif op == OP_EQ:
+            if multi:
+                push(any(value == v.strip().lower() for v in row[idx].split(',')))
+            else:
+                push(row[idx].lower() == value)
+        elif op == OP_NE:
+            if multi:
+                push(all(value != v.strip().lower() for v in row[idx].split(',')))
+            else:
+                push(row[idx].lower() != value)
+        elif op == OP_CONTAINS_ANY:
+            field_value = row[idx].lower()
+            push(any(v in field_value for v in value))
+        elif op == OP_REGEX:
+            if multi:
+                push(any(value.search(v.strip()) is not None
+                         for v in row[idx].split(',')))
+            else:
+                push(value.search(row[idx]) is not None)
+        elif op == OP_JMP_IF_FALSE:
+            if stack[-1]:
+                stack.pop()
+            else:
+                pc = idx
+        elif op == OP_JMP_IF_TRUE:
+            if stack[-1]:
+                pc = idx
+            else:
+                stack.pop()
+        elif op == OP_NOT:
+            stack[-1] = not stack[-1]
+        elif op == OP_TRUE:
+            push(True)
+        else:
+            push(False)
+    return stack.pop()
 
 # Example usage:
 if __name__ == "__main__":
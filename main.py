@@ -4,67 +4,253 @@ Main script to process large CSV files with filtering.
 
 import csv
 import argparse
+import io
+import multiprocessing
+import os
 from tqdm import tqdm
-from config import columns, filter_obj
-from filter_toolkit import filter_row
+from config import columns, filter_obj, filter_row_fast
+from filter_toolkit import to_polars, compile_prescan
 from encoding_detector import detect_encoding, validate_encoding
 
-def count_lines(file_path, encoding='utf-8'):
-    """Count total lines in file for progress bar"""
-    with open(file_path, 'r', encoding=encoding) as f:
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# Cheap raw-line reject (required literals like the UF code and CNAE
+# needles) applied before any CSV tokenization; None if the filter implies
+# no such literals
+_prescan = compile_prescan(filter_obj)
+
+def _filter_batch(lines):
+    """Run the compiled filter over a batch of raw CSV lines in a worker."""
+    # filter_row_fast is specialized at config import time, so each pool
+    # worker gets its own compiled copy for free
+    if _prescan is not None:
+        lines = [line for line in lines if _prescan(line)]
+    reader = csv.reader(lines, delimiter=';', quotechar='"')
+    return [row for row in reader if filter_row_fast(row)]
+
+def _format_row(row):
+    """
+    Serialize one row exactly like csv.writer, but skip the csv module for
+    the overwhelmingly common case of fields with nothing to quote.
+    """
+    for field in row:
+        if ';' in field or '"' in field or '\n' in field or '\r' in field:
+            buf = io.StringIO()
+            csv.writer(buf, delimiter=';', quotechar='"').writerow(row)
+            return buf.getvalue()
+    return ';'.join(row) + '\r\n'
+
+def _write_rows(outfile, rows):
+    """Write rows to a binary output file as one encoded block."""
+    if rows:
+        outfile.write(''.join(map(_format_row, rows)).encode('utf-8'))
+
+def _iter_line_batches(infile, batch_size):
+    """Yield lists of up to batch_size raw lines from an open text file."""
+    batch = []
+    for line in infile:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def process_csv_polars(input_file: str, output_file: str) -> int:
+    """
+    Filter the CSV with Polars as one streaming columnar query.
+
+    Reads the file in batches, evaluates the whole filter as a single
+    boolean mask in vectorized kernels and sinks matching rows straight to
+    the output file, bypassing csv.reader and the per-row predicate.
+
+    Args:
+        input_file: Path to input CSV file (must be UTF-8)
+        output_file: Path to output CSV file
+
+    Returns:
+        int: Number of matching rows written
+    """
+    expr = to_polars(filter_obj)
+    lazy_frame = pl.scan_csv(
+        input_file,
+        separator=';',
+        quote_char='"',
+        has_header=False,
+        skip_rows=1,
+        new_columns=columns,
+        infer_schema=False,
+        missing_utf8_is_empty_string=True,
+    )
+    lazy_frame.filter(expr).sink_csv(output_file, separator=';')
+    with open(output_file, 'r', encoding='utf-8') as f:
         return sum(1 for _ in f) - 1  # Subtract header
 
-def process_csv(input_file: str, output_file: str, chunk_size: int = 1000):
+def process_csv_arrow(input_file: str, output_file: str, encoding: str) -> int:
+    """
+    Filter the CSV with PyArrow's streaming reader plus the Polars filter.
+
+    pyarrow.csv parses and decodes in C (including non-UTF-8 encodings that
+    Polars cannot read directly), yielding ~32MB columnar batches that are
+    handed to Polars zero-copy and filtered with the same vectorized
+    expression as the pure-Polars path.
+
+    Args:
+        input_file: Path to input CSV file
+        output_file: Path to output CSV file
+        encoding: Input file encoding
+
+    Returns:
+        int: Number of matching rows written
+    """
+    expr = to_polars(filter_obj)
+    read_options = pa_csv.ReadOptions(
+        encoding=encoding, column_names=columns, skip_rows=1,
+        block_size=32 << 20)
+    parse_options = pa_csv.ParseOptions(delimiter=';', quote_char='"')
+    convert_options = pa_csv.ConvertOptions(
+        column_types={column: pa.string() for column in columns})
+
+    matches = 0
+    with pa_csv.open_csv(input_file, read_options=read_options,
+                         parse_options=parse_options,
+                         convert_options=convert_options) as reader, \
+         open(output_file, 'w', encoding='utf-8', newline='') as outfile:
+        outfile.write(';'.join(columns) + '\n')
+        for batch in reader:
+            matched = pl.from_arrow(batch).filter(expr)
+            matches += matched.height
+            matched.write_csv(outfile, include_header=False, separator=';')
+    return matches
+
+def process_csv(input_file: str, output_file: str, chunk_size: int = 1000,
+                workers: int = None):
     """
     Process CSV file in chunks and write matching rows to output file.
-    
+
     Args:
         input_file: Path to input CSV file
         output_file: Path to output CSV file
         chunk_size: Number of rows to process at once
+        workers: Number of filter processes (default: all cores). Row
+            filtering is CPU-bound in the interpreter, so batches of lines
+            are fanned out to a multiprocessing pool; pass 1 to stay
+            single-process.
     """
+    if workers is None:
+        workers = os.cpu_count() or 1
     print(f"Processing {input_file}")
     print(f"Using columns from config: {columns}")
     print(f"Filter object: {filter_obj}")
     
-    # Detect encoding
-    detected_encoding, first_row = detect_encoding(input_file)
+    # Detect encoding; a clean sample decode makes the separate validation
+    # pass redundant
+    detected_encoding, first_row, validated = detect_encoding(input_file)
     print(f"Detected encoding: {detected_encoding}")
-    
-    # Validate encoding
-    if not validate_encoding(input_file, detected_encoding):
+
+    if not validated and not validate_encoding(input_file, detected_encoding):
         print("Encoding validation failed, falling back to latin-1")
         detected_encoding = 'latin-1'
     
-    # Count total lines for progress bar
-    try:
-        total_lines = count_lines(input_file, detected_encoding)
-    except UnicodeDecodeError:
-        print("Failed to count lines with detected encoding, trying latin-1")
-        detected_encoding = 'latin-1'
-        total_lines = count_lines(input_file, detected_encoding)
-    
+    # Vectorized fast path: Polars can only read UTF-8, so fall back to the
+    # row-by-row loop for other encodings or untranslatable filters
+    if pl is not None and detected_encoding.lower() in ('utf-8', 'utf8', 'ascii'):
+        try:
+            matches = process_csv_polars(input_file, output_file)
+        except ValueError as e:
+            print(f"Filter not translatable to Polars ({e}), using row-by-row path")
+        except pl.exceptions.ComputeError as e:
+            # The sample decoded as UTF-8 but the full file does not; fall
+            # back to latin-1 like the validation path would have
+            print(f"Polars could not decode the file ({e}), falling back to latin-1")
+            detected_encoding = 'latin-1'
+        else:
+            print(f"\nProcessing complete!")
+            print(f"Total matches: {matches}")
+            return
+
+    # Other encodings: PyArrow's C parser can still decode them into
+    # columnar batches for the same vectorized filter
+    if pa is not None and pl is not None:
+        try:
+            matches = process_csv_arrow(input_file, output_file, detected_encoding)
+        except ValueError as e:
+            print(f"Filter not translatable to Polars ({e}), using row-by-row path")
+        else:
+            print(f"\nProcessing complete!")
+            print(f"Total matches: {matches}")
+            return
+
+    # Progress is tracked in bytes consumed: counting lines up front would
+    # read the whole file once just to size the bar
+    total_bytes = os.path.getsize(input_file)
+
     # Process file
     with open(input_file, 'r', encoding=detected_encoding) as infile, \
-         open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-        
-        reader = csv.reader(infile, delimiter=';', quotechar='"')
-        writer = csv.writer(outfile, delimiter=';', quotechar='"')
-        
+         open(output_file, 'wb', buffering=4 << 20) as outfile:
+
         # Write header
-        writer.writerow(columns)
-        
+        _write_rows(outfile, [columns])
+
         # Skip CSV header
-        next(reader)
-        
+        next(infile)
+
         # Process rows
         matches = 0
-        with tqdm(total=total_lines, desc=f"Processing rows (using {detected_encoding})") as pbar:
-            for row in reader:
-                if filter_row(row, columns, filter_obj):
-                    writer.writerow(row)
-                    matches += 1
-                pbar.update(1)
+        bytes_seen = 0
+        with tqdm(total=total_bytes, unit='B', unit_scale=True,
+                  miniters=1 << 20, mininterval=0.5,
+                  desc=f"Processing rows (using {detected_encoding})") as pbar:
+            def update_progress():
+                # infile.buffer.tell() is the byte position of the underlying
+                # binary stream; close enough for a progress bar
+                nonlocal bytes_seen
+                position = infile.buffer.tell()
+                pbar.update(position - bytes_seen)
+                bytes_seen = position
+
+            if workers > 1:
+                # Fan batches of raw lines out to the pool; each worker
+                # parses and filters its batch with its own compiled filter
+                with multiprocessing.Pool(workers) as pool:
+                    for matched in pool.imap(
+                            _filter_batch, _iter_line_batches(infile, chunk_size)):
+                        _write_rows(outfile, matched)
+                        matches += len(matched)
+                        update_progress()
+            else:
+                # Reject lines missing a required literal before paying for
+                # CSV tokenization of all 30 fields
+                source = filter(_prescan, infile) if _prescan is not None else infile
+                reader = csv.reader(source, delimiter=';', quotechar='"')
+                # Buffer matches and flush them with one writerows call per
+                # batch; likewise batch progress updates, since a Python
+                # call per row is a measurable cost on multi-million-row
+                # files
+                batch = []
+                pending = 0
+                for row in reader:
+                    if filter_row_fast(row):
+                        batch.append(row)
+                        matches += 1
+                        if len(batch) >= 1000:
+                            _write_rows(outfile, batch)
+                            batch.clear()
+                    pending += 1
+                    if pending >= 10000:
+                        update_progress()
+                        pending = 0
+                _write_rows(outfile, batch)
+                update_progress()
     
     print(f"\nProcessing complete!")
     print(f"Total matches: {matches}")
@@ -74,11 +260,12 @@ if __name__ == "__main__":
     parser.add_argument('input_file', help='Input CSV file path')
     parser.add_argument('--output', '-o', default='output.csv', help='Output CSV file path')
     parser.add_argument('--chunk_size', '-c', type=int, default=1000, help='Number of rows to process at once')
-    
+    parser.add_argument('--workers', '-w', type=int, default=None, help='Number of filter processes (default: all cores)')
+
     args = parser.parse_args()
-    
+
     try:
-        process_csv(args.input_file, args.output, args.chunk_size)
+        process_csv(args.input_file, args.output, args.chunk_size, args.workers)
     except KeyboardInterrupt:
         print("\nProcessing interrupted by user")
     except Exception as e:
@@ -27,6 +27,5 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "tqdm>=4.66.1",
-        "chardet>=5.0.0",
     ],
 ) 
\ No newline at end of file